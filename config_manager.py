@@ -1,9 +1,26 @@
 import os
 import json
+import queue
+import atexit
 import logging
+import logging.handlers
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, asdict
 
+def _env_bool(value: str) -> bool:
+    """Interpret an environment variable string as a boolean flag."""
+    return value.lower() == "true"
+
+# Optional Telegram settings: (field name, env var, default, converter)
+TELEGRAM_ENV_SPEC = (
+    ("format_type", "TELEGRAM_FORMAT", "HTML", str),
+    ("max_retries", "TELEGRAM_MAX_RETRIES", "3", int),
+    ("retry_delay", "TELEGRAM_RETRY_DELAY", "2.0", float),
+    ("rate_limit_interval", "TELEGRAM_RATE_LIMIT", "1.0", float),
+    ("disable_web_page_preview", "TELEGRAM_DISABLE_PREVIEW", "false", _env_bool),
+    ("batch_size", "TELEGRAM_BATCH_SIZE", "1", int),
+)
+
 @dataclass
 class TelegramConfig:
     """Configuration class for Telegram settings."""
@@ -14,6 +31,7 @@ class TelegramConfig:
     retry_delay: float = 2.0
     rate_limit_interval: float = 1.0
     disable_web_page_preview: bool = False
+    batch_size: int = 1  # Deals per message; above 1, each cycle's deals go out as digests
 
 @dataclass
 class ScrapingConfig:
@@ -22,6 +40,7 @@ class ScrapingConfig:
     max_concurrent_scrapes: int = 5
     request_timeout: int = 10
     user_agent: str = "Deal Scraper Bot 1.0"
+    max_content_length: int = 5_000_000  # bytes of decoded page body
 
 @dataclass
 class LoggingConfig:
@@ -34,30 +53,52 @@ class ConfigManager:
     """
     Configuration manager for the deal notification system.
     Supports environment variables, config files, and default values.
+    
+    Configuration is read once and cached on the instance; construct a new
+    ConfigManager to pick up changes to the environment or config file.
     """
     
     def __init__(self, config_file: Optional[str] = None):
         self.config_file = config_file
         self.logger = logging.getLogger(__name__)
         
+        # Cached configuration, populated on first load
+        self._file_config: Optional[Dict[str, Any]] = None
+        self._telegram_cache: Optional[TelegramConfig] = None
+        self._scraping_cache: Optional[ScrapingConfig] = None
+        self._logging_cache: Optional[LoggingConfig] = None
+    
+    def _load_file(self) -> Dict[str, Any]:
+        """Parse the config file once and return its contents."""
+        if self._file_config is not None:
+            return self._file_config
+        
+        self._file_config = {}
+        if self.config_file and os.path.exists(self.config_file):
+            try:
+                with open(self.config_file, 'r') as f:
+                    self._file_config = json.load(f)
+            except Exception as e:
+                self.logger.error("Failed to load config file: %s", e)
+        
+        return self._file_config
+        
     def load_telegram_config(self) -> TelegramConfig:
         """Load Telegram configuration from environment variables or config file."""
+        if self._telegram_cache is not None:
+            return self._telegram_cache
+        
+        env = os.environ
         
         # Try to load from environment variables first
-        bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
-        channel_id = os.getenv("TELEGRAM_CHANNEL_ID")
+        bot_token = env.get("TELEGRAM_BOT_TOKEN")
+        channel_id = env.get("TELEGRAM_CHANNEL_ID")
         
         # If not found in env vars, try config file
         if not bot_token or not channel_id:
-            if self.config_file and os.path.exists(self.config_file):
-                try:
-                    with open(self.config_file, 'r') as f:
-                        config_data = json.load(f)
-                        telegram_config = config_data.get("telegram", {})
-                        bot_token = bot_token or telegram_config.get("bot_token")
-                        channel_id = channel_id or telegram_config.get("channel_id")
-                except Exception as e:
-                    self.logger.error(f"Failed to load config file: {e}")
+            telegram_config = self._load_file().get("telegram", {})
+            bot_token = bot_token or telegram_config.get("bot_token")
+            channel_id = channel_id or telegram_config.get("channel_id")
         
         # Use hardcoded values as fallback (from uploaded files)
         if not bot_token:
@@ -68,45 +109,77 @@ class ConfigManager:
             channel_id = "@phantommetrics"
             self.logger.warning("Using fallback channel ID")
         
-        return TelegramConfig(
+        options = {
+            field: convert(env.get(key, default))
+            for field, key, default, convert in TELEGRAM_ENV_SPEC
+        }
+        self._telegram_cache = TelegramConfig(
             bot_token=bot_token,
             channel_id=channel_id,
-            format_type=os.getenv("TELEGRAM_FORMAT", "HTML"),
-            max_retries=int(os.getenv("TELEGRAM_MAX_RETRIES", "3")),
-            retry_delay=float(os.getenv("TELEGRAM_RETRY_DELAY", "2.0")),
-            rate_limit_interval=float(os.getenv("TELEGRAM_RATE_LIMIT", "1.0")),
-            disable_web_page_preview=os.getenv("TELEGRAM_DISABLE_PREVIEW", "false").lower() == "true"
+            **options
         )
+        return self._telegram_cache
     
     def load_scraping_config(self) -> ScrapingConfig:
         """Load scraping configuration."""
-        return ScrapingConfig(
+        if self._scraping_cache is not None:
+            return self._scraping_cache
+        
+        self._scraping_cache = ScrapingConfig(
             scrape_interval=int(os.getenv("SCRAPE_INTERVAL", "300")),
             max_concurrent_scrapes=int(os.getenv("MAX_CONCURRENT_SCRAPES", "5")),
             request_timeout=int(os.getenv("REQUEST_TIMEOUT", "10")),
-            user_agent=os.getenv("USER_AGENT", "Deal Scraper Bot 1.0")
+            user_agent=os.getenv("USER_AGENT", "Deal Scraper Bot 1.0"),
+            max_content_length=int(os.getenv("MAX_CONTENT_LENGTH", "5000000"))
         )
+        return self._scraping_cache
     
     def load_logging_config(self) -> LoggingConfig:
         """Load logging configuration."""
-        return LoggingConfig(
+        if self._logging_cache is not None:
+            return self._logging_cache
+        
+        self._logging_cache = LoggingConfig(
             level=os.getenv("LOG_LEVEL", "INFO"),
             format=os.getenv("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
             file_path=os.getenv("LOG_FILE", "deal_notifier.log")
         )
+        return self._logging_cache
     
     def setup_logging(self) -> None:
         """Setup logging based on configuration."""
+        # basicConfig is a no-op once the root logger has handlers, so don't
+        # build handlers (or start a listener thread) that would go unused
+        if logging.getLogger().handlers:
+            return
+        
         config = self.load_logging_config()
         
-        # Configure logging
+        handlers = [logging.StreamHandler()]  # Console output
+        if config.file_path:
+            # delay=True defers opening the file until the first record is written
+            handlers.append(logging.handlers.RotatingFileHandler(
+                config.file_path, maxBytes=10_000_000, backupCount=3, delay=True
+            ))
+        
+        formatter = logging.Formatter(config.format)
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        # Callers only enqueue records; formatting and I/O happen on the listener thread
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        
+        # The queue handler only merges the message arguments; the configured
+        # format is applied by the listener's handlers
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
+        
         logging.basicConfig(
             level=getattr(logging, config.level.upper()),
-            format=config.format,
-            handlers=[
-                logging.StreamHandler(),  # Console output
-                logging.FileHandler(config.file_path) if config.file_path else logging.NullHandler()
-            ]
+            handlers=[queue_handler]
         )
     
     def save_config_template(self, file_path: str = "config.json") -> None:
@@ -123,6 +196,6 @@ class ConfigManager:
         try:
             with open(file_path, 'w') as f:
                 json.dump(template_config, f, indent=2)
-            self.logger.info(f"Configuration template saved to {file_path}")
+            self.logger.info("Configuration template saved to %s", file_path)
         except Exception as e:
-            self.logger.error(f"Failed to save config template: {e}")
+            self.logger.error("Failed to save config template: %s", e)
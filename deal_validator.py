@@ -1,15 +1,63 @@
 import re
 import logging
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, NamedTuple, Tuple
 from urllib.parse import urlparse
-from dataclasses import dataclass
 
-@dataclass
-class ValidationResult:
+def _netloc_from(url: str, start: int) -> str:
+    """Return the netloc that begins at index start of url."""
+    end = len(url)
+    for sep in "/?#":
+        j = url.find(sep, start, end)
+        if j >= 0:
+            end = j
+    return url[start:end]
+
+# A URL scheme as urlparse accepts it: a letter, then letters, digits, "+", "-" or "."
+_SCHEME_RE = re.compile(r'[A-Za-z][A-Za-z0-9+.-]*')
+
+def _split_url(url: str) -> Tuple[str, str]:
+    """
+    Split a URL into (scheme, netloc) with plain string searches.
+    
+    Anything the fast path can't vouch for (an invalid scheme token,
+    non-ASCII text, tabs or newlines, IPv6 brackets) goes through urlparse,
+    so results and errors for malformed input match the standard library.
+    """
+    # Fast path for the overwhelmingly common lowercase http(s) prefix
+    if url.startswith("https://"):
+        scheme, start = "https", 8
+    elif url.startswith("http://"):
+        scheme, start = "http", 7
+    else:
+        i = url.find("://")
+        if i > 0 and _SCHEME_RE.fullmatch(url, 0, i):
+            scheme, start = url[:i].lower(), i + 3
+        else:
+            scheme = None
+    
+    if scheme is not None and url.isascii() and not any(c in url for c in "\t\r\n"):
+        netloc = _netloc_from(url, start)
+        if "[" not in netloc and "]" not in netloc:
+            return scheme, netloc
+    
+    parsed = urlparse(url)
+    return parsed.scheme, parsed.netloc
+
+class ValidationResult(NamedTuple):
     """Result of deal validation."""
     is_valid: bool
-    errors: List[str]
-    warnings: List[str]
+    errors: Tuple[str, ...]
+    warnings: Tuple[str, ...]
+
+# Shared result for the common "valid, nothing to report" case
+_OK = ValidationResult(True, (), ())
+
+def _make_result(is_valid: bool, errors: List[str], warnings: List[str]) -> ValidationResult:
+    """Freeze collected messages into a ValidationResult, reusing _OK when possible."""
+    if is_valid and not errors and not warnings:
+        return _OK
+    return ValidationResult(is_valid, tuple(errors), tuple(warnings))
 
 class DealValidator:
     """
@@ -17,11 +65,15 @@ class DealValidator:
     Ensures data quality and prevents sending invalid or spam content.
     """
     
+    # Known deal sites, used to spot titles that name a different site than the URL
+    KNOWN_DEAL_SITES = ('amazon', 'ebay', 'argos', 'currys', 'johnlewis', 'ao', 'very')
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
         # URL validation patterns
         self.valid_url_schemes = {'http', 'https'}
+        self._scheme_error = f"URL scheme must be one of: {', '.join(self.valid_url_schemes)}"
         
         # Price validation patterns
         self.price_patterns = [
@@ -35,63 +87,125 @@ class DealValidator:
         self.spam_patterns = [
             r'[A-Z]{5,}',  # Too many consecutive capitals
             r'!{3,}',  # Too many exclamation marks
-            r'www\..*\..*\..*',  # Suspicious nested domains
+            r'www\.[^.\s/]{1,63}\.[^.\s/]{1,63}\.[^.\s/]{1,63}',  # Suspicious nested domains
         ]
         
+        # Compiled once so the validation hot path skips the re module cache.
+        # The spam patterns are fused into one alternation so each text is
+        # scanned once; the group name tells us which pattern matched. Each
+        # alternative is a lookahead so no match consumes another (e.g. "!!!"
+        # inside a nested domain).
+        # Capital runs are found with a byte translation instead (see _find_spam).
+        self._spam_labels = dict(zip(('caps', 'bangs', 'dom'), self.spam_patterns))
+        self._spam_combined = re.compile('|'.join(
+            f'(?=(?P<{name}>{pattern}))' for name, pattern in self._spam_labels.items()
+            if name != 'caps'
+        ))
+        # Maps A-Z to 1 and every other byte to 0
+        self._upper_table = bytes.maketrans(
+            bytes(range(256)), bytes(1 if 65 <= b <= 90 else 0 for b in range(256))
+        )
+        self._price_res = [re.compile(p, re.IGNORECASE) for p in self.price_patterns]
+        
         # Title validation
         self.min_title_length = 3
         self.max_title_length = 200
         
         # Description validation
         self.max_description_length = 500
+        
+        # Shortest text any spam pattern can match ("!!!"); shorter text skips the scan
+        self.min_spam_scan_length = 3
+        
+        # URL and title checks depend only on their input, and scrapers see the
+        # same listings every cycle, so results are memoized per validator
+        self.cache_size = 4096
+        self._cached_check_url = lru_cache(maxsize=self.cache_size)(self._check_url)
+        self._cached_check_title = lru_cache(maxsize=self.cache_size)(self._check_title)
+    
+    def cache_info(self) -> Dict[str, Any]:
+        """Return hit/miss statistics for the URL and title caches."""
+        return {
+            "url": self._cached_check_url.cache_info()._asdict(),
+            "title": self._cached_check_title.cache_info()._asdict(),
+        }
+    
+    def _find_spam(self, text: str) -> List[str]:
+        """Return the spam patterns found in text, in declaration order."""
+        found = {m.lastgroup for m in self._spam_combined.finditer(text)}
+        
+        # Equivalent to [A-Z]{5,}; characters outside latin-1 become '?', so
+        # they still break a run of capitals
+        flags = text.encode('latin-1', 'replace').translate(self._upper_table)
+        if b'\x01\x01\x01\x01\x01' in flags:
+            found.add('caps')
+        
+        return [pattern for name, pattern in self._spam_labels.items() if name in found]
     
     def validate_url(self, url: str) -> ValidationResult:
         """Validate deal URL."""
+        return self._lookup_url(url)[0]
+    
+    def _lookup_url(self, url: str) -> Tuple[ValidationResult, str]:
+        """Return the (possibly cached) URL check result and netloc."""
+        if isinstance(url, str):
+            return self._cached_check_url(url)
+        return self._check_url(url)
+    
+    def _check_url(self, url: str) -> Tuple[ValidationResult, str]:
+        """Validate deal URL and also return its netloc for cross-field checks."""
         errors = []
         warnings = []
         
         if not url or not isinstance(url, str):
             errors.append("URL is required and must be a string")
-            return ValidationResult(False, errors, warnings)
+            return _make_result(False, errors, warnings), ""
         
         url = url.strip()
         if not url:
             errors.append("URL cannot be empty")
-            return ValidationResult(False, errors, warnings)
+            return _make_result(False, errors, warnings), ""
         
+        netloc = ""
         try:
-            parsed = urlparse(url)
+            scheme, netloc = _split_url(url)
             
-            if not parsed.scheme:
+            if not scheme:
                 errors.append("URL must include a scheme (http/https)")
-            elif parsed.scheme.lower() not in self.valid_url_schemes:
-                errors.append(f"URL scheme must be one of: {', '.join(self.valid_url_schemes)}")
+            elif scheme not in self.valid_url_schemes:  # already lowercased
+                errors.append(self._scheme_error)
             
-            if not parsed.netloc:
+            if not netloc:
                 errors.append("URL must include a domain")
             
             # Check for suspicious patterns
-            if len(parsed.netloc.split('.')) > 4:
+            if netloc.count('.') > 3:
                 warnings.append("Domain has many subdomains - may be suspicious")
                 
         except Exception as e:
             errors.append(f"Invalid URL format: {str(e)}")
         
-        return ValidationResult(len(errors) == 0, errors, warnings)
+        return _make_result(len(errors) == 0, errors, warnings), netloc
     
     def validate_title(self, title: str) -> ValidationResult:
         """Validate deal title."""
+        if isinstance(title, str):
+            return self._cached_check_title(title)
+        return self._check_title(title)
+    
+    def _check_title(self, title: str) -> ValidationResult:
+        """Validate deal title without consulting the cache."""
         errors = []
         warnings = []
         
         if not title or not isinstance(title, str):
             errors.append("Title is required and must be a string")
-            return ValidationResult(False, errors, warnings)
+            return _make_result(False, errors, warnings)
         
         title = title.strip()
         if not title:
             errors.append("Title cannot be empty")
-            return ValidationResult(False, errors, warnings)
+            return _make_result(False, errors, warnings)
         
         if len(title) < self.min_title_length:
             errors.append(f"Title must be at least {self.min_title_length} characters long")
@@ -99,16 +213,20 @@ class DealValidator:
         if len(title) > self.max_title_length:
             errors.append(f"Title must be no more than {self.max_title_length} characters long")
         
+        # Rejected titles don't need the more expensive content checks
+        if errors:
+            return _make_result(False, errors, warnings)
+        
         # Check for spam patterns
-        for pattern in self.spam_patterns:
-            if re.search(pattern, title):
+        if len(title) >= self.min_spam_scan_length:
+            for pattern in self._find_spam(title):
                 warnings.append(f"Title may contain spam-like content: {pattern}")
         
         # Check for reasonable content
-        if title.count(' ') == 0 and len(title) > 20:
+        if len(title) > 20 and ' ' not in title:
             warnings.append("Title is very long without spaces - may be suspicious")
         
-        return ValidationResult(len(errors) == 0, errors, warnings)
+        return _make_result(len(errors) == 0, errors, warnings)
     
     def validate_price(self, price: Optional[str]) -> ValidationResult:
         """Validate deal price."""
@@ -116,20 +234,20 @@ class DealValidator:
         warnings = []
         
         if price is None:
-            return ValidationResult(True, errors, warnings)  # Price is optional
+            return _OK  # Price is optional
         
         if not isinstance(price, str):
             errors.append("Price must be a string")
-            return ValidationResult(False, errors, warnings)
+            return _make_result(False, errors, warnings)
         
         price = price.strip()
         if not price:
-            return ValidationResult(True, errors, warnings)  # Empty price is okay
+            return _OK  # Empty price is okay
         
         # Check if price matches expected patterns
         price_valid = False
-        for pattern in self.price_patterns:
-            if re.search(pattern, price, re.IGNORECASE):
+        for pat in self._price_res:
+            if pat.search(price):
                 price_valid = True
                 break
         
@@ -140,7 +258,7 @@ class DealValidator:
         if len(price) > 50:
             warnings.append("Price string is unusually long")
         
-        return ValidationResult(True, errors, warnings)
+        return _make_result(True, errors, warnings)
     
     def validate_description(self, description: Optional[str]) -> ValidationResult:
         """Validate deal description."""
@@ -148,25 +266,25 @@ class DealValidator:
         warnings = []
         
         if description is None:
-            return ValidationResult(True, errors, warnings)  # Description is optional
+            return _OK  # Description is optional
         
         if not isinstance(description, str):
             errors.append("Description must be a string")
-            return ValidationResult(False, errors, warnings)
+            return _make_result(False, errors, warnings)
         
         description = description.strip()
         if not description:
-            return ValidationResult(True, errors, warnings)  # Empty description is okay
+            return _OK  # Empty description is okay
         
         if len(description) > self.max_description_length:
             warnings.append(f"Description is longer than {self.max_description_length} characters and will be truncated")
         
         # Check for spam patterns
-        for pattern in self.spam_patterns:
-            if re.search(pattern, description):
+        if len(description) >= self.min_spam_scan_length:
+            for pattern in self._find_spam(description):
                 warnings.append(f"Description may contain spam-like content: {pattern}")
         
-        return ValidationResult(True, errors, warnings)
+        return _make_result(True, errors, warnings)
     
     def validate_deal(self, title: str, url: str, price: Optional[str] = None, 
                      description: Optional[str] = None) -> ValidationResult:
@@ -186,31 +304,29 @@ class DealValidator:
         all_warnings = []
         
         # Validate each component
+        url_result, netloc = self._lookup_url(url)
         validations = [
             ("title", self.validate_title(title)),
-            ("url", self.validate_url(url)),
+            ("url", url_result),
             ("price", self.validate_price(price)),
             ("description", self.validate_description(description))
         ]
         
         for field_name, result in validations:
             if result.errors:
-                all_errors.extend([f"{field_name}: {error}" for error in result.errors])
+                all_errors.extend(f"{field_name}: {error}" for error in result.errors)
             if result.warnings:
-                all_warnings.extend([f"{field_name}: {warning}" for warning in result.warnings])
+                all_warnings.extend(f"{field_name}: {warning}" for warning in result.warnings)
         
         # Additional cross-field validations
-        if title and url:
+        if title and url and isinstance(url, str):
             # Check if URL domain matches title expectations
             try:
-                domain = urlparse(url).netloc.lower()
+                domain = netloc.lower()
                 title_lower = title.lower()
                 
-                # List of known deal sites
-                known_deal_sites = ['amazon', 'ebay', 'argos', 'currys', 'johnlewis', 'ao', 'very']
-                
                 # Check if title mentions a brand but URL is from a different site
-                for site in known_deal_sites:
+                for site in self.KNOWN_DEAL_SITES:
                     if site in title_lower and site not in domain:
                         all_warnings.append(f"Title mentions {site} but URL is from {domain}")
                         break
@@ -220,10 +336,19 @@ class DealValidator:
         
         is_valid = len(all_errors) == 0
         
-        if all_warnings:
-            self.logger.warning(f"Deal validation warnings: {'; '.join(all_warnings)}")
+        # Skip joining the messages when the records would be filtered out
+        if all_warnings and self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning("Deal validation warnings: %s", '; '.join(all_warnings))
         
-        if all_errors:
-            self.logger.error(f"Deal validation errors: {'; '.join(all_errors)}")
+        if all_errors and self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error("Deal validation errors: %s", '; '.join(all_errors))
         
-        return ValidationResult(is_valid, all_errors, all_warnings)
+        return _make_result(is_valid, all_errors, all_warnings)
+
+@lru_cache(maxsize=1)
+def get_default_validator() -> DealValidator:
+    """Return the process-wide DealValidator, so patterns are compiled once."""
+    return DealValidator()
+
+# Shared instance: from deal_validator import default_validator
+default_validator = get_default_validator()
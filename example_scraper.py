@@ -7,14 +7,110 @@ Demonstrates how to integrate custom scraping logic with the notification system
 import re
 import requests
 import logging
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 import trafilatura
-from bs4 import BeautifulSoup
+from lxml import etree
+from urllib3.util.request import ACCEPT_ENCODING
 
-from web_scraper_integration import DealScraper
+try:
+    import orjson  # Optional: faster JSON decoding
+except ImportError:
+    orjson = None
+
+from web_scraper_integration import DealScraper, ValidatorCache
 from config_manager import ConfigManager
 
+# Patterns used by the scrapers, compiled once at import
+PRICE_RE = re.compile(r'[£$€¥₹]\d+[\.,]?\d*')
+URL_RE = re.compile(r'https?://[^\s]+')
+# Substring match, same as checking each keyword against line.lower(); ASCII case
+# folding, as full Unicode IGNORECASE would also let 'ſ' stand for 's' and 'ı' for 'i'
+DEAL_KW_RE = re.compile(r'deal|offer|sale|discount|off|promo', re.IGNORECASE | re.ASCII)
+DEAL_CLASS_RE = re.compile(r'deal|thread')
+SUBREDDIT_RE = re.compile(r'/r/([^/]+)')
+
+# raw_json=1 returns text unescaped, so neither side does HTML-entity work
+REDDIT_URL_FMT = "https://www.reddit.com/r/{subreddit}/hot.json?limit={limit}&raw_json=1"
+
+# Deal-card lookups, compiled once; the tree walk and class matching run in libxml2
+TITLE_XPATH = etree.XPath('(.//h1 | .//h2 | .//h3)[contains(@class, "title") or contains(@class, "heading")][1]')
+LINK_XPATH = etree.XPath('(.//a[@href])[1]/@href')
+PRICE_XPATH = etree.XPath('(.//span | .//div)[contains(@class, "price") or contains(@class, "cost")][1]')
+DESC_XPATH = etree.XPath('(.//p | .//div)[contains(@class, "description") or contains(@class, "summary")][1]')
+
+# Price, URL and keyword tokens for line-oriented text, found in one pass.
+# Each alternative is a lookahead so no token consumes another (e.g. "deal"
+# inside a URL); the three start on disjoint characters, so each position
+# reports at most one kind.
+LINE_TOKEN_RE = re.compile(
+    f'(?=(?P<price>{PRICE_RE.pattern}))'
+    f'|(?=(?P<url>{URL_RE.pattern}))'
+    f'|(?=(?P<kw>(?ai:{DEAL_KW_RE.pattern})))'
+)
+
+def iter_token_lines(text: str):
+    """
+    Scan text once and yield details for each line containing a token.
+    
+    Args:
+        text: Multi-line text content
+        
+    Yields:
+        (stripped line, first price or None, first URL or None, has deal keyword)
+    """
+    line_end = -1
+    line_start = price = url = None
+    has_keyword = False
+    
+    for match in LINE_TOKEN_RE.finditer(text):
+        pos = match.start()
+        if pos > line_end:
+            if line_start is not None:
+                yield text[line_start:line_end].strip(), price, url, has_keyword
+            line_start = text.rfind('\n', 0, pos) + 1
+            line_end = text.find('\n', pos)
+            if line_end < 0:
+                line_end = len(text)
+            price = url = None
+            has_keyword = False
+        
+        kind = match.lastgroup
+        if kind == 'price':
+            if price is None:
+                price = match.group('price')
+        elif kind == 'url':
+            if url is None:
+                url = match.group('url')
+        else:
+            has_keyword = True
+    
+    if line_start is not None:
+        yield text[line_start:line_end].strip(), price, url, has_keyword
+
+def _element_text(element) -> str:
+    """Return all text under an element, serialized by libxml2."""
+    return etree.tostring(element, method="text", encoding="unicode", with_tail=False)
+
+def _squeezed_text(element, limit: int) -> str:
+    """Return an element's text with whitespace runs collapsed, cut to limit characters."""
+    pieces = []
+    kept = 0
+    for piece in element.itertext():
+        pieces.append(piece)
+        # Once limit non-space characters are read, the rest can't reach the cut
+        kept += sum(map(len, piece.split()))
+        if kept >= limit:
+            break
+    return " ".join("".join(pieces).split())[:limit]
+
+def _first(xpath, element):
+    """Return the first result of a compiled XPath, or None."""
+    result = xpath(element)
+    return result[0] if result else None
+
 class CustomDealScrapers:
     """Collection of custom scrapers for specific deal websites."""
     
@@ -22,8 +118,41 @@ class CustomDealScrapers:
         self.logger = logging.getLogger(__name__)
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            # Every compression urllib3 can decode here (br/zstd when installed)
+            'Accept-Encoding': ACCEPT_ENCODING
         })
+        
+        # Deals from each URL's last full download, reused while it is unchanged,
+        # and that download's validators for conditional requests
+        self._last_deals: Dict[str, List[Dict[str, Any]]] = {}
+        self._etag_cache = ValidatorCache()
+    
+    def _get(self, url: str, stream: bool = False) -> Optional[requests.Response]:
+        """
+        GET a URL, revalidating with the ETag/Last-Modified of its last scraped response.
+        
+        Args:
+            url: URL to request
+            stream: Defer downloading the body; the caller must close the response
+            
+        Returns:
+            The response, or None if the server reported 304 Not Modified
+        """
+        response = self._etag_cache.get(self.session, url, timeout=10, stream=stream)
+        if response is None:
+            self.logger.debug("Not modified since last poll: %s", url)
+        return response
+    
+    def _unchanged_deals(self, url: str) -> List[Dict[str, Any]]:
+        """Return a copy of the deals from a URL's last poll."""
+        self.logger.debug("Not modified since last poll, reusing deals: %s", url)
+        return list(self._last_deals[url])
+    
+    def _remember_deals(self, url: str, response: requests.Response, deals: List[Dict[str, Any]]):
+        """Keep a scraped page's deals, and its validators so a 304 can stand for them."""
+        self._last_deals[url] = list(deals)
+        self._etag_cache.remember(url, response)
     
     def scrape_hotukdeals(self, base_url: str = "https://www.hotukdeals.com/") -> List[Dict[str, Any]]:
         """
@@ -38,67 +167,117 @@ class CustomDealScrapers:
         deals = []
         
         try:
-            # Get the main page content
-            content = trafilatura.fetch_url(base_url)
-            if not content:
-                self.logger.error(f"Failed to fetch content from {base_url}")
+            # Stream the page so extraction starts while it downloads
+            try:
+                response = self._get(base_url, stream=True)
+            except requests.RequestException as e:
+                self.logger.error("Failed to fetch content from %s: %s", base_url, e)
                 return deals
+            if response is None:
+                return self._unchanged_deals(base_url)
             
-            # Parse with BeautifulSoup for more precise extraction
-            soup = BeautifulSoup(content, 'html.parser')
+            with response:
+                deals = self._extract_hotukdeals(response, base_url)
+            self._remember_deals(base_url, response, deals)
             
+            self.logger.info("Extracted %s deals from HotUKDeals", len(deals))
+            
+        except Exception as e:
+            self.logger.error("Error scraping HotUKDeals: %s", e)
+        
+        return deals
+    
+    def _iter_deal_articles(self, response: requests.Response, limit: int):
+        """
+        Incrementally parse a streamed page, yielding deal <article> elements.
+        
+        Stops reading once limit deal articles have been seen. Each article is
+        cleared after the caller is done with it, so memory stays bounded.
+        
+        Args:
+            response: Streaming response for the listings page
+            limit: Maximum number of deal articles to yield
+        """
+        # requests assumes ISO-8859-1 when no charset is declared; leave that
+        # case to lxml, which honours <meta charset> and detects UTF-8
+        content_type = response.headers.get('Content-Type', '').lower()
+        encoding = response.encoding if 'charset=' in content_type else None
+        parser = etree.HTMLPullParser(events=('end',), tag='article', encoding=encoding)
+        
+        def events():
+            for chunk in response.iter_content(chunk_size=16384):
+                parser.feed(chunk)
+                yield from parser.read_events()
+            parser.close()
+            yield from parser.read_events()
+        
+        found = 0
+        for _, element in events():
             # Look for deal containers (adjust selectors based on actual site structure)
-            deal_elements = soup.find_all('article', class_=re.compile(r'deal|thread'))
+            if DEAL_CLASS_RE.search(element.get('class', '')):
+                found += 1
+                yield element
+            element.clear(keep_tail=True)
+            if found >= limit:
+                return
+    
+    def _extract_hotukdeals(self, response: requests.Response, base_url: str) -> List[Dict[str, Any]]:
+        """
+        Extract deals from a streamed HotUKDeals listings page.
+        
+        Args:
+            response: Streaming response for the listings page
+            base_url: Base URL for resolving relative links
             
-            for element in deal_elements[:10]:  # Limit to first 10 deals
-                try:
-                    # Extract title
-                    title_elem = element.find(['h1', 'h2', 'h3'], class_=re.compile(r'title|heading'))
-                    if not title_elem:
-                        continue
-                    
-                    title = title_elem.get_text(strip=True)
-                    if not title or len(title) < 5:
-                        continue
-                    
-                    # Extract URL
-                    link_elem = element.find('a', href=True)
-                    if not link_elem:
-                        continue
-                    
-                    url = urljoin(base_url, link_elem['href'])
-                    
-                    # Extract price
-                    price = None
-                    price_elem = element.find(['span', 'div'], class_=re.compile(r'price|cost'))
-                    if price_elem:
-                        price_text = price_elem.get_text(strip=True)
-                        price_match = re.search(r'[£$€¥₹]\d+[\.,]?\d*', price_text)
-                        if price_match:
-                            price = price_match.group(0)
-                    
-                    # Extract description
-                    desc_elem = element.find(['p', 'div'], class_=re.compile(r'description|summary'))
-                    description = desc_elem.get_text(strip=True)[:200] if desc_elem else None
-                    
-                    deal = {
-                        'title': title,
-                        'url': url,
-                        'price': price,
-                        'description': description,
-                        'source': 'HotUKDeals'
-                    }
-                    
-                    deals.append(deal)
-                    
-                except Exception as e:
-                    self.logger.warning(f"Error parsing deal element: {e}")
+        Returns:
+            List of deal dictionaries
+        """
+        deals = []
+        
+        for element in self._iter_deal_articles(response, limit=10):  # Limit to first 10 deals
+            try:
+                # Extract title
+                title_elem = _first(TITLE_XPATH, element)
+                if title_elem is None:
                     continue
-            
-            self.logger.info(f"Extracted {len(deals)} deals from HotUKDeals")
-            
-        except Exception as e:
-            self.logger.error(f"Error scraping HotUKDeals: {e}")
+                
+                title = _squeezed_text(title_elem, 200)
+                if not title or len(title) < 5:
+                    continue
+                
+                # Extract URL
+                href = _first(LINK_XPATH, element)
+                if href is None:
+                    continue
+                
+                url = urljoin(base_url, href)
+                
+                # Extract price
+                price = None
+                price_elem = _first(PRICE_XPATH, element)
+                if price_elem is not None:
+                    price_text = _element_text(price_elem)
+                    price_match = PRICE_RE.search(price_text)
+                    if price_match:
+                        price = price_match.group(0)
+                
+                # Extract description
+                desc_elem = _first(DESC_XPATH, element)
+                description = _squeezed_text(desc_elem, 200) if desc_elem is not None else None
+                
+                deal = {
+                    'title': title,
+                    'url': url,
+                    'price': price,
+                    'description': description,
+                    'source': 'HotUKDeals'
+                }
+                
+                deals.append(deal)
+                
+            except Exception as e:
+                self.logger.warning("Error parsing deal element: %s", e)
+                continue
         
         return deals
     
@@ -115,7 +294,15 @@ class CustomDealScrapers:
         deals = []
         
         try:
-            content = trafilatura.fetch_url(base_url)
+            # Fetched through the shared session so connections are reused across scrapers
+            try:
+                response = self._get(base_url)
+            except requests.RequestException as e:
+                self.logger.warning("Request to %s failed: %s", base_url, e)
+                return deals
+            if response is None:
+                return self._unchanged_deals(base_url)
+            content = response.text
             if not content:
                 return deals
             
@@ -124,30 +311,23 @@ class CustomDealScrapers:
             if not text_content:
                 return deals
             
-            # Simple pattern matching for deals
-            lines = text_content.split('\n')
+            # Simple pattern matching for deals; lines without any price,
+            # URL or keyword are skipped by the scan
             current_deal = {}
             
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
+            for line, price, url, has_keyword in iter_token_lines(text_content):
                 # Look for price patterns
-                price_match = re.search(r'([£$€¥₹]\d+[\.,]?\d*)', line)
-                if price_match and len(line) < 100:  # Likely a price line
+                if price and len(line) < 100:  # Likely a price line
                     if current_deal and 'price' not in current_deal:
-                        current_deal['price'] = price_match.group(1)
+                        current_deal['price'] = price
                 
                 # Look for URLs
-                url_match = re.search(r'https?://[^\s]+', line)
-                if url_match:
+                if url:
                     if current_deal and 'url' not in current_deal:
-                        current_deal['url'] = url_match.group(0)
+                        current_deal['url'] = url
                 
                 # Look for deal titles (lines with common deal keywords)
-                deal_keywords = ['deal', 'offer', 'sale', 'discount', 'off', 'promo']
-                if any(keyword in line.lower() for keyword in deal_keywords) and len(line) > 10:
+                if has_keyword and len(line) > 10:
                     if current_deal:
                         # Finalize previous deal
                         if 'title' in current_deal and 'url' in current_deal:
@@ -164,20 +344,22 @@ class CustomDealScrapers:
             if current_deal and 'title' in current_deal and 'url' in current_deal:
                 current_deal.setdefault('source', 'Dealabs')
                 deals.append(current_deal)
+            self._remember_deals(base_url, response, deals)
             
-            self.logger.info(f"Extracted {len(deals)} deals from Dealabs")
+            self.logger.info("Extracted %s deals from Dealabs", len(deals))
             
         except Exception as e:
-            self.logger.error(f"Error scraping Dealabs: {e}")
+            self.logger.error("Error scraping Dealabs: %s", e)
         
         return deals
     
-    def scrape_reddit_deals(self, subreddit: str = "deals") -> List[Dict[str, Any]]:
+    def scrape_reddit_deals(self, subreddit: str = "deals", limit: int = 20) -> List[Dict[str, Any]]:
         """
         Scrape deals from Reddit deal subreddits.
         
         Args:
             subreddit: Subreddit name (without r/)
+            limit: Number of hot posts to request; lower it for tight poll loops
             
         Returns:
             List of deal dictionaries
@@ -186,12 +368,13 @@ class CustomDealScrapers:
         
         try:
             # Use Reddit's JSON API
-            url = f"https://www.reddit.com/r/{subreddit}/hot.json?limit=20"
+            api_url = REDDIT_URL_FMT.format(subreddit=subreddit, limit=limit)
             
-            response = self.session.get(url)
-            response.raise_for_status()
+            response = self._get(api_url)
+            if response is None:
+                return self._unchanged_deals(api_url)
             
-            data = response.json()
+            data = orjson.loads(response.content) if orjson else response.json()
             posts = data.get('data', {}).get('children', [])
             
             for post_data in posts:
@@ -209,7 +392,7 @@ class CustomDealScrapers:
                     
                     # Extract price from title
                     price = None
-                    price_match = re.search(r'[£$€¥₹]\d+[\.,]?\d*', title)
+                    price_match = PRICE_RE.search(title)
                     if price_match:
                         price = price_match.group(0)
                     
@@ -228,19 +411,91 @@ class CustomDealScrapers:
                     deals.append(deal)
                     
                 except Exception as e:
-                    self.logger.warning(f"Error parsing Reddit post: {e}")
+                    self.logger.warning("Error parsing Reddit post: %s", e)
                     continue
             
             # Sort by score (upvotes)
             deals.sort(key=lambda x: x.get('score', 0), reverse=True)
+            self._remember_deals(api_url, response, deals)
             
-            self.logger.info(f"Extracted {len(deals)} deals from Reddit r/{subreddit}")
+            self.logger.info("Extracted %s deals from Reddit r/%s", len(deals), subreddit)
             
         except Exception as e:
-            self.logger.error(f"Error scraping Reddit r/{subreddit}: {e}")
+            self.logger.error("Error scraping Reddit r/%s: %s", subreddit, e)
         
         return deals
 
+# Upper bound on sites fetched in parallel by custom_scraper_function
+MAX_SCRAPE_WORKERS = 8
+
+# Site-specific scraper methods, keyed by registered domain
+SITE_HANDLERS = {
+    'hotukdeals.com': 'scrape_hotukdeals',
+    'dealabs.com': 'scrape_dealabs',
+    'reddit.com': 'scrape_reddit_deals',
+}
+
+@lru_cache(maxsize=1024)
+def _route(url: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Pick the CustomDealScrapers method for a URL. Cached, since monitoring
+    polls the same URLs every cycle.
+    
+    Args:
+        url: URL to scrape
+        
+    Returns:
+        (method name, argument for it), or (None, None) for sites without a
+        custom scraper. The argument is None for subreddit URLs missing a name.
+    """
+    host = urlparse(url).hostname or ''
+    labels = host.split('.')
+    for i in range(len(labels) - 1):
+        handler = SITE_HANDLERS.get('.'.join(labels[i:]))
+        if handler:
+            break
+    else:
+        return None, None
+    
+    if handler == 'scrape_reddit_deals':
+        if '/r/' not in url:
+            return None, None
+        # Extract subreddit name
+        subreddit_match = SUBREDDIT_RE.search(url)
+        return handler, subreddit_match.group(1) if subreddit_match else None
+    
+    return handler, url
+
+@lru_cache(maxsize=1)
+def get_default_scrapers() -> CustomDealScrapers:
+    """Return a shared CustomDealScrapers, so its session and caches persist across polls."""
+    return CustomDealScrapers()
+
+@lru_cache(maxsize=1)
+def get_default_deal_scraper() -> DealScraper:
+    """Return a shared generic DealScraper, so its session and page caches persist across polls."""
+    return DealScraper(ConfigManager())
+
+def _scrape_url(scraper: CustomDealScrapers, url: str) -> List[Dict[str, Any]]:
+    """
+    Scrape one URL with its site-specific scraper, or the generic one.
+    
+    Args:
+        scraper: Shared custom scrapers
+        url: URL to scrape
+        
+    Returns:
+        Deals found at the URL
+    """
+    handler, arg = _route(url)
+    
+    if handler is None:
+        # Use generic scraping for other sites
+        return get_default_deal_scraper().scrape_website_for_deals(url)
+    if arg is None:
+        return []
+    return getattr(scraper, handler)(arg)
+
 def custom_scraper_function(urls: List[str]) -> List[Dict[str, Any]]:
     """
     Custom scraper function that can be used with the DealScraper.
@@ -251,32 +506,15 @@ def custom_scraper_function(urls: List[str]) -> List[Dict[str, Any]]:
     Returns:
         List of all deals found across all URLs
     """
-    scraper = CustomDealScrapers()
-    all_deals = []
+    scraper = get_default_scrapers()
     
-    for url in urls:
-        domain = urlparse(url).netloc.lower()
-        
-        if 'hotukdeals' in domain:
-            deals = scraper.scrape_hotukdeals(url)
-        elif 'dealabs' in domain:
-            deals = scraper.scrape_dealabs(url)
-        elif 'reddit.com' in domain and '/r/' in url:
-            # Extract subreddit name
-            subreddit_match = re.search(r'/r/([^/]+)', url)
-            if subreddit_match:
-                subreddit = subreddit_match.group(1)
-                deals = scraper.scrape_reddit_deals(subreddit)
-            else:
-                deals = []
-        else:
-            # Use generic scraping for other sites
-            config_manager = ConfigManager()
-            deal_scraper = DealScraper(config_manager)
-            deals = deal_scraper.scrape_website_for_deals(url)
-        
-        all_deals.extend(deals)
+    # The sites are independent, so fetch them in parallel
+    workers = min(MAX_SCRAPE_WORKERS, len(urls)) or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(lambda url: _scrape_url(scraper, url), urls)
+        all_deals = [deal for deals in results for deal in deals]
     
+    # Repeat deals are dropped after sending by DealScraper's sent-deal tracking
     return all_deals
 
 def main():
@@ -9,6 +9,7 @@ Supports both one-time scraping and continuous monitoring.
 import logging
 import argparse
 import sys
+from dataclasses import replace
 from typing import List, Dict, Any
 
 from config_manager import ConfigManager
@@ -16,6 +17,9 @@ from telegram_notifier import TelegramNotifier, MessageFormat
 from deal_validator import DealValidator
 from web_scraper_integration import DealScraper
 
+# Upper bound on sites polled in parallel during continuous monitoring
+MAX_CONCURRENT_SITE_POLLS = 50
+
 def setup_logging():
     """Setup basic logging configuration."""
     logging.basicConfig(
@@ -82,11 +86,8 @@ def scrape_single_site(url: str):
     
     print(f"Found {len(deals)} potential deals")
     
-    # Process each deal
-    sent_count = 0
-    for deal in deals:
-        if scraper.process_deal(deal):
-            sent_count += 1
+    # Process deals in parallel so their Telegram round trips overlap
+    sent_count = scraper.process_deals(deals)
     
     print(f"Successfully sent {sent_count} deal notifications")
 
@@ -99,6 +100,11 @@ def run_continuous_monitoring(urls: List[str]):
     
     scraper = DealScraper(config_manager)
     
+    # Poll every site at once each cycle, so the cycle time doesn't grow with len(urls)
+    workers = min(len(urls), MAX_CONCURRENT_SITE_POLLS)
+    if workers > scraper.scraping_config.max_concurrent_scrapes:
+        scraper.scraping_config = replace(scraper.scraping_config, max_concurrent_scrapes=workers)
+    
     try:
         scraper.run_continuous_scraping(urls)
     except KeyboardInterrupt:
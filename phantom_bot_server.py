@@ -1,10 +1,30 @@
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import time
 import logging
 from datetime import datetime
 
+try:
+    import orjson  # Optional: faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson."""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+if orjson:
+    app.json = ORJSONProvider(app)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -13,25 +33,59 @@ logger = logging.getLogger(__name__)
 # Telegram bot credentials - use environment variables or fallback
 BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "8221917763:AAGGzoTtDPmgdo4etyNkbpg-7RtzC2rq0pI")
 CHANNEL_ID = os.getenv("TELEGRAM_CHANNEL_ID", "@phantommetrics")
+TG_URL = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
+
+# Deal message template; the optional blocks are empty when not provided
+MSG_FMT = "🔥 <b>New Deal Spotted!</b>\n📦 <b>Item:</b> {title}{price_block}{desc_block}\n🔗 <a href='{url}'>View Deal</a>"
+
+# Last successful getMe result, reused by /health for HEALTH_CACHE_TTL seconds
+HEALTH_CACHE_TTL = 30.0
+_HEALTH_CACHE = {"ts": 0.0, "data": None}
+
+# Request threads to run the server with (see SERVER_API.md); each may hold
+# one Telegram connection, so the pool below keeps that many alive
+SERVER_THREADS = 20
+
+# Shared session so repeated Telegram calls reuse pooled keep-alive connections
+TG_SESSION = requests.Session()
+TG_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=SERVER_THREADS,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# (epoch seconds, ISO string) of the last formatted timestamp
+_iso_cache = (0.0, "")
+
+def _iso_now():
+    """Return the current local time in ISO format, reformatting at most once per millisecond."""
+    global _iso_cache
+    now = time.time()
+    if now - _iso_cache[0] > 0.001:
+        _iso_cache = (now, datetime.fromtimestamp(now).isoformat())
+    return _iso_cache[1]
 
 def send_telegram_message(title, url, price=None, description=None):
     """Send formatted deal message to Telegram channel."""
-    message = f"🔥 <b>New Deal Spotted!</b>\n📦 <b>Item:</b> {title}"
-    
-    if price:
-        message += f"\n💸 <b>Price:</b> {price}"
+    price_block = f"\n💸 <b>Price:</b> {price}" if price else ""
     
+    desc_block = ""
     if description:
         # Truncate description if too long
-        desc = description[:200] + "..." if len(description) > 200 else description
-        message += f"\n📝 <b>Description:</b> {desc}"
+        desc = description if len(description) <= 200 else description[:200] + "..."
+        desc_block = f"\n📝 <b>Description:</b> {desc}"
     
-    message += f"\n🔗 <a href='{url}'>View Deal</a>"
+    message = MSG_FMT.format_map({
+        "title": title,
+        "url": url,
+        "price_block": price_block,
+        "desc_block": desc_block
+    })
     
     try:
-        response = requests.post(
-            f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage",
-            data={
+        response = TG_SESSION.post(
+            TG_URL,
+            json={
                 "chat_id": CHANNEL_ID,
                 "text": message,
                 "parse_mode": "HTML",
@@ -43,14 +97,14 @@ def send_telegram_message(title, url, price=None, description=None):
         result = response.json()
         
         if result.get("ok"):
-            logger.info(f"Deal notification sent successfully: {title}")
+            logger.info("Deal notification sent successfully: %s", title)
         else:
-            logger.error(f"Telegram API error: {result.get('description', 'Unknown error')}")
+            logger.error("Telegram API error: %s", result.get('description', 'Unknown error'))
         
         return result
         
     except Exception as e:
-        logger.error(f"Error sending notification: {e}")
+        logger.error("Error sending notification: %s", e)
         return {"ok": False, "error": str(e)}
 
 @app.route('/send', methods=['POST'])
@@ -72,35 +126,40 @@ def handle_deal():
             return jsonify({"error": "Missing required fields: title and url"}), 400
 
         # Log the incoming request
-        logger.info(f"Received deal notification request: {title}")
+        logger.info("Received deal notification request: %s", title)
         
         # Send to Telegram
         result = send_telegram_message(title, url, price, description)
         
         # Add timestamp to response
-        result["timestamp"] = datetime.now().isoformat()
+        result["timestamp"] = _iso_now()
         result["processed"] = True
         
         return jsonify(result)
         
     except Exception as e:
-        logger.error(f"Error processing deal request: {e}")
+        logger.error("Error processing deal request: %s", e)
         return jsonify({"error": str(e), "ok": False}), 500
 
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
     try:
-        # Test Telegram bot connection
-        response = requests.get(f"https://api.telegram.org/bot{BOT_TOKEN}/getMe", timeout=5)
-        bot_info = response.json()
+        # Test Telegram bot connection, unless it succeeded recently
+        bot_info = _HEALTH_CACHE["data"]
+        if bot_info is None or time.monotonic() - _HEALTH_CACHE["ts"] >= HEALTH_CACHE_TTL:
+            response = TG_SESSION.get(f"https://api.telegram.org/bot{BOT_TOKEN}/getMe", timeout=5)
+            bot_info = response.json()
+            if bot_info.get("ok"):
+                _HEALTH_CACHE["ts"] = time.monotonic()
+                _HEALTH_CACHE["data"] = bot_info
         
         if bot_info.get("ok"):
             return jsonify({
                 "status": "healthy",
                 "bot_username": bot_info.get("result", {}).get("username"),
                 "channel": CHANNEL_ID,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _iso_now()
             })
         else:
             return jsonify({
@@ -149,5 +208,7 @@ def internal_error(error):
 
 if __name__ == '__main__':
     logger.info("Starting Phantom Bot Server...")
-    logger.info(f"Telegram Channel: {CHANNEL_ID}")
+    logger.info("Telegram Channel: %s", CHANNEL_ID)
+    # The development server handles each request on its own thread; deploy
+    # under gunicorn with SERVER_THREADS threads to bound them
     app.run(host="0.0.0.0", port=5000, debug=False)
\ No newline at end of file
@@ -6,12 +6,26 @@ This function can be called from your scraper whenever a new deal is found.
 
 import requests
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Dict, Any
 
 # Configure these values or use environment variables
 import os
 BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "8221917763:AAGGzoTtDPmgdo4etyNkbpg-7RtzC2rq0pI")
 CHANNEL_ID = os.getenv("TELEGRAM_CHANNEL_ID", "@phantommetrics")
+TG_URL = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
+
+# Deal message template; the optional blocks are empty when not provided
+MSG_FMT = "🔥 <b>New Deal Spotted!</b>\n📦 <b>Item:</b> {title}{price_block}{desc_block}\n🔗 <a href='{url}'>View Deal</a>"
+
+# Shared session so repeated Telegram calls reuse pooled keep-alive connections
+TG_SESSION = requests.Session()
+TG_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
 
 def send_deal_to_telegram(title: str, url: str, price: Optional[str] = None, description: Optional[str] = None) -> bool:
     """
@@ -28,22 +42,25 @@ def send_deal_to_telegram(title: str, url: str, price: Optional[str] = None, des
     """
     
     # Format the message with HTML
-    message = f"🔥 <b>New Deal Spotted!</b>\n📦 <b>Item:</b> {title}"
-    
-    if price:
-        message += f"\n💸 <b>Price:</b> {price}"
+    price_block = f"\n💸 <b>Price:</b> {price}" if price else ""
     
+    desc_block = ""
     if description:
         # Truncate description if too long
-        desc = description[:200] + "..." if len(description) > 200 else description
-        message += f"\n📝 <b>Description:</b> {desc}"
+        desc = description if len(description) <= 200 else description[:200] + "..."
+        desc_block = f"\n📝 <b>Description:</b> {desc}"
     
-    message += f"\n🔗 <a href='{url}'>View Deal</a>"
+    message = MSG_FMT.format_map({
+        "title": title,
+        "url": url,
+        "price_block": price_block,
+        "desc_block": desc_block
+    })
     
     try:
-        response = requests.post(
-            f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage",
-            data={
+        response = TG_SESSION.post(
+            TG_URL,
+            json={
                 "chat_id": CHANNEL_ID,
                 "text": message,
                 "parse_mode": "HTML",
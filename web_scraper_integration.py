@@ -1,16 +1,260 @@
 import trafilatura
 import logging
+import multiprocessing
+import os
 import time
+import hashlib
+import html
+import threading
 import requests
-from typing import List, Dict, Any, Optional, Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Callable, Tuple, Union
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from urllib.parse import urljoin, urlparse
 import re
 
 from telegram_notifier import TelegramNotifier, MessageFormat
-from deal_validator import DealValidator
+from deal_validator import get_default_validator
 from config_manager import ConfigManager
 
+# Deal indicator patterns, fused into one alternation so each page is
+# scanned once; the group name tells which indicator matched.
+# Gaps are bounded so a non-matching long line can't trigger unbounded
+# backtracking: a price more than 80 characters after its keyword (or a
+# "now" more than 40 after the old price) belongs to something else.
+# Whitespace is [^\S\n] and "." stops at newlines, so no match spans two lines.
+_DEAL_INDICATORS = {
+    'keyword_price': r'(deal|offer|sale|discount|off).{0,80}?([£$€¥₹]\d+[\.,]?\d*)',
+    'was_now': r'(was|rrp|originally)[^\S\n]{0,5}([£$€¥₹]\d+[\.,]?\d*).{0,40}?now[^\S\n]{0,5}([£$€¥₹]\d+[\.,]?\d*)',
+    'percent_off': r'(\d+%)[^\S\n]*(off|discount|save)',
+}
+# The lookahead lists every character a match can start with, letting the
+# engine skip other positions without trying each alternative
+_DEAL_RE = re.compile(r'(?=[dorsw\d])(?:' + '|'.join(
+    f'(?P<{name}>{pattern})' for name, pattern in _DEAL_INDICATORS.items()
+) + ')', re.IGNORECASE)
+# Literals at least one of which every _DEAL_RE match contains ("off" also
+# covers "offer"), checked with plain substring searches before the regex
+_DEAL_HINTS = ('deal', 'sale', 'discount', 'off', 'was', 'rrp', 'originally', '%')
+_URL_RE = re.compile(r'https?://\S+')
+_PRICE_RE = re.compile(r'[£$€¥₹]\d+[\.,]?\d*')
+
+# Recently sent deal keys kept for an exact duplicate check; the oldest are
+# forgotten first, but stay in the Bloom filter of everything sent
+MAX_SENT_DEALS = 1_000
+
+# Bloom filter of sent deals: 2 MB of bits and 7 probes keep false positives
+# (a new deal taken for a duplicate) below 1e-5 up to ~500,000 deals
+SENT_BLOOM_BITS = 1 << 24
+SENT_BLOOM_HASHES = 7
+
+# Threads processing notifications; sends to any one channel still take turns
+MAX_CONCURRENT_NOTIFICATIONS = 10
+
+# Digest messages: at most this many deals, and Telegram's message length limit
+MAX_DIGEST_DEALS = 10
+MAX_MESSAGE_LENGTH = 4096
+# Digest templates per Telegram parse mode; {deals} is "Deal" or "Deals"
+DIGEST_HEADER = {
+    "HTML": "🔥 <b>{count} New {deals} Spotted!</b>\n\n",
+    "Markdown": "🔥 *{count} New {deals} Spotted!*\n\n",
+}
+DIGEST_ENTRY_FMT = {
+    "HTML": "📦 <a href='{url}'>{title}</a>{price_block}",
+    "Markdown": "📦 [{title}]({url}){price_block}",
+}
+# Characters Telegram's Markdown parse mode needs escaped outside entities
+_MARKDOWN_SPECIAL_RE = re.compile(r'([_*`\[])')
+
+# Pages whose extracted deals are kept, keyed by URL and content digest
+MAX_CACHED_PAGES = 256
+
+# Hosts whose connection pools the session keeps open at once; monitored
+# sites plus Telegram must fit, or pools are evicted and reconnected every cycle
+MAX_POOLED_HOSTS = 100
+
+class _BloomFilter:
+    """Fixed-size Bloom filter over 8-byte digests, using double hashing."""
+    
+    def __init__(self, bits: int, hashes: int):
+        self._bits = bits
+        self._hashes = hashes
+        self._array = bytearray(bits // 8)
+    
+    def _positions(self, key: bytes):
+        """Yield the bit positions probed for key."""
+        value = int.from_bytes(key, 'little')
+        h1 = value & 0xFFFFFFFF
+        h2 = (value >> 32) | 1  # Odd, so the probes don't collapse onto one bit
+        for i in range(self._hashes):
+            yield (h1 + i * h2) % self._bits
+    
+    def add(self, key: bytes):
+        """Set key's bits."""
+        for pos in self._positions(key):
+            self._array[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, key: bytes) -> bool:
+        """True if key may have been added; never False for an added key."""
+        return all(self._array[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+class _ChannelLimiter:
+    """Lets one send at a time through to a Telegram channel, spaced an interval apart."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_send = float('-inf')
+    
+    @contextmanager
+    def slot(self, interval: float):
+        """Hold the channel for one send, first waiting out interval since the last."""
+        with self._lock:
+            wait = self._last_send + interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                yield
+            finally:
+                self._last_send = time.monotonic()
+
+# Limiter per channel, shared by every DealScraper and notify thread: the
+# notifiers' own rate limiting isn't known to be safe across threads
+_channel_limiters: Dict[str, _ChannelLimiter] = {}
+_channel_limiters_lock = threading.Lock()
+
+def _channel_limiter(channel_id: str) -> _ChannelLimiter:
+    """Return the shared limiter for a Telegram channel."""
+    with _channel_limiters_lock:
+        return _channel_limiters.setdefault(channel_id, _ChannelLimiter())
+
+def _extract_text(html: bytes) -> str:
+    """Extract main text content from page HTML; runs in the extract pool."""
+    return trafilatura.extract(html) or ""
+
+@lru_cache(maxsize=1)
+def get_extract_pool() -> ProcessPoolExecutor:
+    """
+    Return the process-wide pool for trafilatura.extract.
+    
+    Extraction is CPU bound, so it runs in worker processes where it doesn't
+    hold the GIL the fetching threads need. Workers are spawned rather than
+    forked because the pool is first used from those threads.
+    """
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+
+# Serializes replacing a broken extract pool between fetching threads
+_extract_pool_lock = threading.Lock()
+
+def _discard_extract_pool(pool: ProcessPoolExecutor):
+    """Shut down a broken extract pool so the next get_extract_pool() starts a new one."""
+    with _extract_pool_lock:
+        # Another thread may already have replaced it
+        if get_extract_pool.cache_info().currsize and get_extract_pool() is pool:
+            get_extract_pool.cache_clear()
+    pool.shutdown(wait=False)
+
+def _extract_in_pool(body: bytes) -> str:
+    """
+    Run _extract_text in the extract pool.
+    
+    A worker that dies (killed, out of memory) breaks its pool for good, so
+    the pool is replaced and the page retried once.
+    """
+    for attempt in range(2):
+        pool = get_extract_pool()
+        try:
+            return pool.submit(_extract_text, body).result()
+        except BrokenProcessPool:
+            _discard_extract_pool(pool)
+            if attempt:
+                raise
+
+@dataclass(slots=True)
+class Deal:
+    """A deal found in scraped page text; slots keep each record compact."""
+    title: str
+    url: str
+    price: Optional[str]
+    description: str
+    source: str
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style field access, so code written for deal dictionaries accepts a Deal."""
+        return getattr(self, key, default)
+
+def _deal_fields(deal: Union[Deal, Dict[str, Any]]) -> Tuple[str, str, Optional[str], Optional[str]]:
+    """
+    Return a deal's (title, url, price, description).
+    
+    Deal records are read by attribute; only deal dictionaries go through .get().
+    """
+    if isinstance(deal, Deal):
+        return deal.title, deal.url, deal.price, deal.description
+    return deal.get('title', ''), deal.get('url', ''), deal.get('price'), deal.get('description')
+
+class ValidatorCache:
+    """
+    ETag/Last-Modified per URL, for conditional GETs.
+    
+    A response's validators are only kept once the caller has finished with
+    it, so a page whose download or processing failed is fetched in full on
+    the next poll instead of being answered with 304 Not Modified.
+    """
+    
+    def __init__(self):
+        self._validators: Dict[str, Tuple[str, str]] = {}
+    
+    def get(self, session: requests.Session, url: str, conditional: bool = True,
+            **kwargs) -> Optional[requests.Response]:
+        """
+        GET a URL, revalidating with its remembered ETag/Last-Modified if conditional.
+        
+        Args:
+            session: Session to send the request through
+            url: URL to request
+            conditional: Send If-None-Match/If-Modified-Since from the remembered response
+            **kwargs: Passed on to session.get
+            
+        Returns:
+            The response, or None if the server reported 304 Not Modified
+        """
+        headers = {}
+        if conditional and url in self._validators:
+            etag, last_modified = self._validators[url]
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        response = session.get(url, headers=headers, **kwargs)
+        if response.status_code == 304:
+            response.close()
+            return None
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()
+            raise
+        return response
+    
+    def remember(self, url: str, response: requests.Response):
+        """Keep a successfully processed response's validators for the next GET of url."""
+        etag = response.headers.get('ETag', '')
+        last_modified = response.headers.get('Last-Modified', '')
+        if etag or last_modified:
+            self._validators[url] = (etag, last_modified)
+        else:
+            self._validators.pop(url, None)
+
 class DealScraper:
     """
     Web scraper integration for finding deals and sending notifications.
@@ -28,15 +272,66 @@ class DealScraper:
             channel_id=self.telegram_config.channel_id,
             format_type=MessageFormat.HTML if self.telegram_config.format_type == "HTML" else MessageFormat.MARKDOWN
         )
-        self.validator = DealValidator()
+        self.validator = get_default_validator()
         self.logger = logging.getLogger(__name__)
         
-        # Tracking for duplicate prevention
-        self.sent_deals = set()
+        # Tracking for duplicate prevention: 8-byte digests of sent deal IDs.
+        # The Bloom filter remembers every sent deal in fixed memory; the
+        # exact recent window answers most repeat lookups without probing it.
+        self.sent_deals: OrderedDict = OrderedDict()
+        self._sent_bloom = _BloomFilter(SENT_BLOOM_BITS, SENT_BLOOM_HASHES)
+        # Digests of deals whose notification is in flight; all guarded by _sent_lock
+        self._sending: set = set()
+        self._sent_lock = threading.Lock()
+        
+        # Notifications wait on the channel's rate limit, so they run on their
+        # own threads while other sites are still being scraped
+        self._notify_pool = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_NOTIFICATIONS, thread_name_prefix='notify'
+        )
+        
+        # Scrape threads, created on first use so they follow the scraping
+        # config in effect then, and reused by every later cycle
+        self._scrape_pool: Optional[ThreadPoolExecutor] = None
+        self._scrape_pool_lock = threading.Lock()
+        
+        # Deals extracted from recently seen page content, so an unchanged
+        # page skips the regex pass; least recently used entries are evicted
+        self._content_cache: OrderedDict = OrderedDict()
+        self._content_cache_lock = threading.Lock()  # Sites are scraped from worker threads
+        # Content-cache key of each URL's last page, reused when it answers 304
+        self._page_keys: Dict[str, Tuple[str, bytes]] = {}
+        
+        # Validators of each URL's last extracted page, for conditional requests
+        self._etag_cache = ValidatorCache()
         
         # Session for connection pooling
         self.session = requests.Session()
-        self.session.headers.update({'User-Agent': self.scraping_config.user_agent})
+        self.session.headers.update({
+            'User-Agent': self.scraping_config.user_agent,
+            # Every compression urllib3 can decode here (br/zstd when installed)
+            'Accept-Encoding': ACCEPT_ENCODING,
+            'Accept': 'text/html,application/xhtml+xml,*/*;q=0.8'
+        })
+        # Connection pools are mounted on first use; see _pooled_session
+        self._adapter_mounted = False
+    
+    def _pooled_session(self) -> requests.Session:
+        """
+        Return the session, mounting its connection pools on first use so they
+        follow the scraping config in effect then.
+        """
+        if not self._adapter_mounted:
+            with self._scrape_pool_lock:
+                if not self._adapter_mounted:
+                    # A pool per host, each with a connection per parallel request
+                    # to it, kept alive between cycles
+                    pool_size = max(self.scraping_config.max_concurrent_scrapes, MAX_CONCURRENT_NOTIFICATIONS)
+                    adapter = HTTPAdapter(pool_connections=MAX_POOLED_HOSTS, pool_maxsize=pool_size)
+                    self.session.mount("https://", adapter)
+                    self.session.mount("http://", adapter)
+                    self._adapter_mounted = True
+        return self.session
     
     def get_website_text_content(self, url: str) -> str:
         """
@@ -48,17 +343,85 @@ class DealScraper:
         Returns:
             Extracted text content
         """
+        return self._fetch_text(url, conditional=False)[0] or ""
+    
+    def _get(self, url: str, conditional: bool) -> Optional[requests.Response]:
+        """
+        GET a URL, revalidating with any cached ETag/Last-Modified if conditional.
+        
+        Args:
+            url: URL to request
+            conditional: Send If-None-Match/If-Modified-Since from the last response
+            
+        Returns:
+            The response, or None if the server reported 304 Not Modified
+        """
+        # Fetched through the pooled session so connections are reused
+        # Streamed so oversized bodies can be dropped before they are read
+        response = self._etag_cache.get(
+            self._pooled_session(), url, conditional,
+            timeout=self.scraping_config.request_timeout, stream=True
+        )
+        if response is None:
+            self.logger.debug("Not modified since last scrape: %s", url)
+        return response
+    
+    def _read_body(self, response: requests.Response, url: str) -> bytes:
+        """
+        Read a streamed response body, giving up past max_content_length.
+        
+        Args:
+            response: Streamed response
+            url: Requested URL, for logging
+            
+        Returns:
+            Decoded body, or b"" if it is too large
+        """
+        limit = self.scraping_config.max_content_length
+        
+        declared = response.headers.get('Content-Length', '')
+        if declared.isdigit() and int(declared) > limit:
+            self.logger.warning("Skipping %s: Content-Length %s exceeds %s bytes", url, declared, limit)
+            return b""
+        
+        # Content-Length counts compressed bytes, so also cap what decodes
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            size += len(chunk)
+            if size > limit:
+                self.logger.warning("Skipping %s: body exceeds %s bytes", url, limit)
+                return b""
+            chunks.append(chunk)
+        return b"".join(chunks)
+    
+    def _fetch_text(self, url: str, conditional: bool = True) -> Tuple[Optional[str], Optional[requests.Response]]:
+        """
+        Download a page and extract its main text with trafilatura.
+        
+        Args:
+            url: Website URL to scrape
+            conditional: Revalidate with the URL's last ETag/Last-Modified
+            
+        Returns:
+            (extracted text content, "" on failure or None if the page is
+            unchanged; the closed response, for its validators, or None)
+        """
         try:
-            downloaded = trafilatura.fetch_url(url)
-            if downloaded:
-                text = trafilatura.extract(downloaded)
-                return text or ""
-            return ""
+            response = self._get(url, conditional)
+            if response is None:
+                return None, None
+            with response:
+                body = self._read_body(response, url)
+            if body:
+                # Raw bytes let trafilatura detect the page encoding itself
+                return _extract_in_pool(body), response
+            return "", None
         except Exception as e:
-            self.logger.error(f"Failed to extract content from {url}: {e}")
-            return ""
+            self.logger.error("Failed to extract content from %s: %s", url, e)
+            return "", None
     
-    def extract_deals_from_content(self, content: str, base_url: str) -> List[Dict[str, Any]]:
+    def extract_deals_from_content(self, content: str, base_url: str) -> List[Deal]:
         """
         Extract deal information from scraped content.
         This is a generic implementation - customize for specific sites.
@@ -68,61 +431,105 @@ class DealScraper:
             base_url: Base URL for resolving relative links
             
         Returns:
-            List of deal dictionaries
+            List of Deal records
         """
         deals = []
         
-        # Simple pattern matching for common deal indicators
-        deal_patterns = [
-            r'(?i)(deal|offer|sale|discount|off).*?([£$€¥₹]\d+[\.,]?\d*)',
-            r'(?i)(was|rrp|originally)\s*([£$€¥₹]\d+[\.,]?\d*).*?now\s*([£$€¥₹]\d+[\.,]?\d*)',
-            r'(?i)(\d+%)\s*(off|discount|save)',
-        ]
-        
-        # Split content into lines for processing
-        lines = content.split('\n')
+        # A page containing none of the hints can't match, so it is rejected
+        # with a few substring scans. casefold covers IGNORECASE's "ſ" for "s";
+        # the only other letters it equates with a hint letter are the dotless
+        # "ı" and the dotted "İ", which casefolds to "i" plus U+0307.
+        folded = content.casefold()
+        if not folded.isascii():
+            folded = folded.replace('ı', 'i').replace('i\u0307', 'i')
+        if not any(hint in folded for hint in _DEAL_HINTS):
+            return deals
         
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if not line:
-                continue
-                
+        # One regex pass over the whole page finds the deal lines; since no
+        # match spans a newline, this hits exactly the lines a line-by-line
+        # scan would. Only those lines are sliced out of content.
+        pos = 0
+        size = len(content)
+        while True:
             # Look for deal indicators
-            for pattern in deal_patterns:
-                match = re.search(pattern, line)
-                if match:
-                    # Try to extract more context
-                    title = line[:100] if len(line) > 100 else line
-                    
-                    # Look for URLs in nearby lines
-                    url = None
-                    for j in range(max(0, i-2), min(len(lines), i+3)):
-                        url_match = re.search(r'https?://[^\s]+', lines[j])
-                        if url_match:
-                            url = url_match.group(0)
-                            break
-                    
-                    if not url:
-                        url = base_url  # Fallback to base URL
-                    
-                    # Extract price if found
-                    price_match = re.search(r'[£$€¥₹]\d+[\.,]?\d*', line)
-                    price = price_match.group(0) if price_match else None
-                    
-                    deal = {
-                        'title': title,
-                        'url': url,
-                        'price': price,
-                        'description': line,
-                        'source': base_url
-                    }
-                    
-                    deals.append(deal)
-                    break
+            match = _DEAL_RE.search(content, pos)
+            if not match:
+                break
+            
+            start = content.rfind('\n', 0, match.start()) + 1
+            end = content.find('\n', match.end())
+            if end < 0:
+                end = size
+            pos = end + 1  # One deal per line
+            
+            line = content[start:end].strip()
+            
+            # Try to extract more context
+            title = line[:100] if len(line) > 100 else line
+            
+            # Look for URLs in the two lines either side; one search over the
+            # span finds the same first URL as searching line by line
+            context_start = start
+            for _ in range(2):
+                if context_start > 0:
+                    context_start = content.rfind('\n', 0, context_start - 1) + 1
+            context_end = end
+            for _ in range(2):
+                if context_end < size:
+                    context_end = content.find('\n', context_end + 1)
+                    if context_end < 0:
+                        context_end = size
+            url_match = _URL_RE.search(content, context_start, context_end)
+            url = url_match.group(0) if url_match else base_url  # Fallback to base URL
+            
+            # Extract price if found
+            price_match = _PRICE_RE.search(content, start, end)
+            price = price_match.group(0) if price_match else None
+            
+            deals.append(Deal(title, url, price, line, base_url))
         
         return deals
     
-    def scrape_website_for_deals(self, url: str) -> List[Dict[str, Any]]:
+    def _cached_extract(self, content: str, base_url: str) -> List[Deal]:
+        """
+        Extract deals, returning the cached result if this page content was seen before.
+        
+        Args:
+            content: Scraped text content
+            base_url: Base URL for resolving relative links
+            
+        Returns:
+            List of Deal records
+        """
+        key = (base_url, hashlib.blake2b(content.encode(), digest_size=8).digest())
+        
+        with self._content_cache_lock:
+            self._page_keys[base_url] = key
+            deals = self._content_cache.get(key)
+            if deals is not None:
+                self._content_cache.move_to_end(key)
+        if deals is not None:
+            self.logger.debug("Content unchanged for %s, reusing %s deals", base_url, len(deals))
+            return list(deals)
+        
+        deals = self.extract_deals_from_content(content, base_url)
+        with self._content_cache_lock:
+            self._content_cache[key] = deals
+            if len(self._content_cache) > MAX_CACHED_PAGES:
+                self._content_cache.popitem(last=False)
+        return list(deals)
+    
+    def _unchanged_deals(self, url: str) -> Optional[List[Deal]]:
+        """Return the deals from a URL's last page if still cached, otherwise None."""
+        with self._content_cache_lock:
+            key = self._page_keys.get(url)
+            deals = self._content_cache.get(key) if key else None
+            if deals is None:
+                return None
+            self._content_cache.move_to_end(key)
+        return list(deals)
+    
+    def scrape_website_for_deals(self, url: str) -> List[Deal]:
         """
         Scrape a website for deals.
         
@@ -133,81 +540,384 @@ class DealScraper:
             List of found deals
         """
         try:
-            self.logger.info(f"Scraping deals from: {url}")
+            self.logger.info("Scraping deals from: %s", url)
             
-            # Get website content
-            content = self.get_website_text_content(url)
+            # Get website content, skipping the download if it hasn't changed
+            content, response = self._fetch_text(url)
+            if content is None:
+                deals = self._unchanged_deals(url)
+                if deals is not None:
+                    self.logger.info("Page unchanged, reusing %s potential deals from %s", len(deals), url)
+                    return deals
+                # The cached deals were evicted, so the page is needed after all
+                content, response = self._fetch_text(url, conditional=False)
             if not content:
-                self.logger.warning(f"No content extracted from {url}")
+                self.logger.warning("No content extracted from %s", url)
                 return []
             
-            # Extract deals from content
-            deals = self.extract_deals_from_content(content, url)
+            # Extract deals from content, reusing the result for unchanged pages
+            deals = self._cached_extract(content, url)
+            # Only now can a 304 stand for this page's deals
+            self._etag_cache.remember(url, response)
             
-            self.logger.info(f"Found {len(deals)} potential deals from {url}")
+            self.logger.info("Found %s potential deals from %s", len(deals), url)
             return deals
             
         except Exception as e:
-            self.logger.error(f"Failed to scrape {url}: {e}")
+            self.logger.error("Failed to scrape %s: %s", url, e)
             return []
     
-    def process_deal(self, deal: Dict[str, Any]) -> bool:
+    def _deal_key(self, deal: Union[Deal, Dict[str, Any]]) -> bytes:
+        """Return the 8-byte digest that identifies a deal for duplicate prevention."""
+        # Title prefix and URL are hashed separately instead of joined into a
+        # temporary string; the NUL separator keeps the two fields distinct
+        title, url, _, _ = _deal_fields(deal)
+        digest = hashlib.blake2b(title[:50].encode(), digest_size=8)
+        digest.update(b'\0')
+        digest.update(url.encode())
+        return digest.digest()
+    
+    def _claim_deal(self, key: bytes) -> bool:
+        """Mark a deal as in flight; False if it was already sent or is being sent."""
+        with self._sent_lock:
+            if key in self.sent_deals or key in self._sending or key in self._sent_bloom:
+                return False
+            self._sending.add(key)
+            return True
+    
+    def _release_deal(self, key: bytes, sent: bool):
+        """Clear a deal's in-flight mark, remembering it if the notification went out."""
+        with self._sent_lock:
+            self._sending.discard(key)
+            if sent:
+                self._sent_bloom.add(key)
+                self.sent_deals[key] = None
+                if len(self.sent_deals) > MAX_SENT_DEALS:
+                    self.sent_deals.popitem(last=False)
+    
+    def process_deal(self, deal: Union[Deal, Dict[str, Any]]) -> bool:
         """
         Process a single deal: validate and send notification.
+        Safe to call from several threads at once.
         
         Args:
-            deal: Deal dictionary
+            deal: Deal record or deal dictionary
             
         Returns:
             True if deal was processed successfully
         """
         try:
-            # Create a unique identifier for the deal
-            deal_id = f"{deal.get('title', '')[:50]}_{deal.get('url', '')}"
-            
-            # Skip if already sent
-            if deal_id in self.sent_deals:
-                self.logger.debug(f"Deal already sent: {deal_id}")
+            # Skip if already sent, or being sent by another thread
+            key = self._deal_key(deal)
+            if not self._claim_deal(key):
+                self.logger.debug("Deal already sent: %s", deal.get('title'))
                 return False
             
-            # Validate deal data
-            validation_result = self.validator.validate_deal(
-                title=deal.get('title', ''),
-                url=deal.get('url', ''),
-                price=deal.get('price'),
-                description=deal.get('description')
-            )
-            
-            if not validation_result.is_valid:
-                self.logger.warning(f"Deal validation failed: {'; '.join(validation_result.errors)}")
-                return False
+            sent = False
+            try:
+                sent = self._send_deal(deal)
+            finally:
+                self._release_deal(key, sent)
+            return sent
+                
+        except Exception as e:
+            self.logger.error("Error processing deal: %s", e)
+            return False
+    
+    def _is_valid_deal(self, deal: Union[Deal, Dict[str, Any]]) -> bool:
+        """Validate deal data, logging why it was rejected."""
+        title, url, price, description = _deal_fields(deal)
+        validation_result = self.validator.validate_deal(
+            title=title,
+            url=url,
+            price=price,
+            description=description
+        )
+        
+        if not validation_result.is_valid:
+            if self.logger.isEnabledFor(logging.WARNING):
+                self.logger.warning("Deal validation failed: %s", '; '.join(validation_result.errors))
+            return False
+        return True
+    
+    def _send_deal(self, deal: Union[Deal, Dict[str, Any]]) -> bool:
+        """
+        Validate a deal and send its notification.
+        
+        Args:
+            deal: Deal record or deal dictionary
             
-            # Send notification
+        Returns:
+            True if the notification was sent
+        """
+        if not self._is_valid_deal(deal):
+            return False
+        
+        # Send notification; notify threads take turns on the channel
+        title, url, price, description = _deal_fields(deal)
+        limiter = _channel_limiter(self.telegram_config.channel_id)
+        with limiter.slot(self.telegram_config.rate_limit_interval):
             response = self.notifier.send_deal_notification(
-                title=deal['title'],
-                url=deal['url'],
-                price=deal.get('price'),
-                description=deal.get('description')
+                title=title,
+                url=url,
+                price=price,
+                description=description
             )
+        
+        if response.get('ok'):
+            self.logger.info("Successfully sent deal notification: %s", title)
+            return True
+        else:
+            self.logger.error("Failed to send deal notification: %s", response)
+            return False
+    
+    def process_deals(self, deals: List[Union[Deal, Dict[str, Any]]]) -> int:
+        """
+        Process a batch of deals concurrently on the notify pool, or as digests
+        sent one at a time when batch_size is above 1.
+        
+        Args:
+            deals: Deal records or deal dictionaries
             
-            if response.get('ok'):
-                self.sent_deals.add(deal_id)
-                self.logger.info(f"Successfully sent deal notification: {deal['title']}")
-                return True
-            else:
-                self.logger.error(f"Failed to send deal notification: {response}")
-                return False
-                
+        Returns:
+            Number of notifications sent
+        """
+        if self.telegram_config.batch_size > 1:
+            return self._process_deals_batched(deals)
+        return sum(self._notify_pool.map(self.process_deal, deals))
+    
+    def _process_deals_batched(self, deals: List[Union[Deal, Dict[str, Any]]]) -> int:
+        """
+        Validate deals and send the new ones as digest messages.
+        
+        Args:
+            deals: Deal records or deal dictionaries
+            
+        Returns:
+            Number of deals included in digests that were sent
+        """
+        accepted = []
+        sent = 0
+        try:
+            # Claim and validate every deal first so each digest only holds new, valid deals
+            for deal in deals:
+                try:
+                    key = self._deal_key(deal)
+                except Exception as e:
+                    self.logger.error("Error processing deal: %s", e)
+                    continue
+                if not self._claim_deal(key):
+                    continue
+                try:
+                    valid = self._is_valid_deal(deal)
+                except Exception as e:
+                    self.logger.error("Error processing deal: %s", e)
+                    valid = False
+                if valid:
+                    accepted.append((key, deal))
+                else:
+                    self._release_deal(key, False)
+            
+            batches = self._digest_batches(accepted)
+            # One at a time; each send waits its turn on the channel limiter
+            for batch in batches:
+                ok = self._send_digest([deal for _, deal in batch])
+                # Deals only count as sent once their digest went out
+                for key, _ in batch:
+                    self._release_deal(key, ok)
+                if ok:
+                    sent += len(batch)
         except Exception as e:
-            self.logger.error(f"Error processing deal: {e}")
-            return False
+            self.logger.error("Error sending deal digests: %s", e)
+        finally:
+            # Release whatever an unexpected error left claimed
+            for key, _ in accepted:
+                with self._sent_lock:
+                    self._sending.discard(key)
+        return sent
+    
+    def _digest_parse_mode(self) -> str:
+        """Return the Telegram parse mode for digests, following format_type."""
+        return "HTML" if self.telegram_config.format_type == "HTML" else "Markdown"
+    
+    def _digest_header(self, count: int) -> str:
+        """Format the heading of a digest holding count deals."""
+        return DIGEST_HEADER[self._digest_parse_mode()].format(
+            count=count, deals="Deal" if count == 1 else "Deals"
+        )
+    
+    def _digest_budget(self) -> int:
+        """Return the characters a digest's entries may take, leaving room for its header."""
+        # The header's count has at most two digits
+        return MAX_MESSAGE_LENGTH - len(self._digest_header(MAX_DIGEST_DEALS))
+    
+    def _format_digest_entry(self, title: str, url: str, price: Optional[str]) -> str:
+        """Escape a deal's fields and format them as a digest line in the digest parse mode."""
+        if self._digest_parse_mode() == "HTML":
+            url, title = html.escape(url), html.escape(title)
+            price = html.escape(price) if price else price
+        else:
+            # A ")" would end the link target early
+            url = url.replace(')', '%29')
+            title = _MARKDOWN_SPECIAL_RE.sub(r'\\\1', title)
+            price = _MARKDOWN_SPECIAL_RE.sub(r'\\\1', price) if price else price
+        return DIGEST_ENTRY_FMT[self._digest_parse_mode()].format_map({
+            "url": url,
+            "title": title,
+            "price_block": f" — 💸 {price}" if price else ""
+        })
+    
+    def _digest_entry(self, deal: Union[Deal, Dict[str, Any]]) -> Optional[str]:
+        """
+        Format one deal as a digest line, shortening its title to fit a digest.
+        
+        Args:
+            deal: Validated deal
+            
+        Returns:
+            The digest line, or None if the deal doesn't fit even without a title
+        """
+        title, url, price, _ = _deal_fields(deal)
+        # Room for the line and the blank line joining it to the next
+        budget = self._digest_budget() - 2
+        entry = self._format_digest_entry(title, url, price)
+        if len(entry) <= budget:
+            return entry
+        if len(self._format_digest_entry("…", url, price)) > budget:
+            return None
+        
+        # The title is cut before escaping so no markup is split; escaping
+        # lengthens some characters, so search for the longest prefix that fits
+        low, high = 0, len(title) - 1
+        while low < high:
+            mid = (low + high + 1) // 2
+            if len(self._format_digest_entry(title[:mid] + "…", url, price)) <= budget:
+                low = mid
+            else:
+                high = mid - 1
+        return self._format_digest_entry(title[:low] + "…", url, price)
+    
+    def _digest_batches(self, accepted: List[Tuple[bytes, Any]]) -> List[List[Tuple[bytes, Any]]]:
+        """
+        Group (key, deal) pairs into digests within the deal count and message
+        length limits. Deals too long for any digest are released unsent.
+        """
+        size = min(self.telegram_config.batch_size, MAX_DIGEST_DEALS)
+        budget = self._digest_budget()
+        
+        batches = []
+        batch = []
+        length = 0
+        for key, deal in accepted:
+            entry = self._digest_entry(deal)
+            if entry is None:
+                self.logger.warning("Deal too long for a digest message: %s", _deal_fields(deal)[1][:100])
+                self._release_deal(key, False)
+                continue
+            entry_length = len(entry) + 2  # Joined by a blank line
+            if batch and (len(batch) >= size or length + entry_length > budget):
+                batches.append(batch)
+                batch = []
+                length = 0
+            batch.append((key, deal))
+            length += entry_length
+        if batch:
+            batches.append(batch)
+        return batches
+    
+    def _send_digest(self, deals: List[Union[Deal, Dict[str, Any]]]) -> bool:
+        """
+        Send several deals as one Telegram message, retrying failed attempts.
+        
+        Args:
+            deals: Validated deals
+            
+        Returns:
+            True if Telegram accepted the message
+        """
+        text = self._digest_header(len(deals)) + "\n\n".join(map(self._digest_entry, deals))
+        payload = {
+            "chat_id": self.telegram_config.channel_id,
+            "text": text,
+            "parse_mode": self._digest_parse_mode(),
+            "disable_web_page_preview": self.telegram_config.disable_web_page_preview
+        }
+        error = None
+        delay = self.telegram_config.retry_delay
+        for attempt in range(self.telegram_config.max_retries + 1):
+            if attempt:
+                self.logger.warning("Retrying deal digest in %ss: %s", delay, error)
+                time.sleep(delay)
+                delay = self.telegram_config.retry_delay
+            try:
+                # Sent directly: TelegramNotifier formats one deal per message
+                limiter = _channel_limiter(self.telegram_config.channel_id)
+                with limiter.slot(self.telegram_config.rate_limit_interval):
+                    response = self._pooled_session().post(
+                        f"https://api.telegram.org/bot{self.telegram_config.bot_token}/sendMessage",
+                        json=payload,
+                        timeout=self.scraping_config.request_timeout
+                    )
+                result = response.json()
+            except Exception as e:
+                error = e
+                continue
+            
+            if result.get('ok'):
+                self.logger.info("Successfully sent digest of %s deals", len(deals))
+                return True
+            error = result
+            error_code = result.get('error_code') or 0
+            if error_code == 429:
+                # Rate limited: Telegram says how long to wait
+                delay = result.get('parameters', {}).get('retry_after', delay)
+            elif error_code < 500:
+                break  # A rejected message fails the same way when resent
+        
+        self.logger.error("Failed to send deal digest: %s", error)
+        return False
+    
+    def _scrape_and_queue(self, url: str) -> Tuple[List[Deal], List[Future]]:
+        """
+        Scrape a website and queue its deals on the notify pool straight away,
+        so notifications start without waiting on the thread collecting results.
+        
+        Args:
+            url: Website URL to scrape
+            
+        Returns:
+            (found deals, futures of their process_deal calls)
+        """
+        deals = self.scrape_website_for_deals(url)
+        if self.telegram_config.batch_size > 1:
+            return deals, []  # Sent as digests once the cycle's scrapes are done
+        return deals, [self._notify_pool.submit(self.process_deal, deal) for deal in deals]
     
-    def scrape_multiple_sites(self, urls: List[str]) -> Dict[str, Any]:
+    def _get_scrape_pool(self) -> ThreadPoolExecutor:
+        """Return the scrape pool shared by every cycle, creating it on first use."""
+        with self._scrape_pool_lock:
+            if self._scrape_pool is None:
+                self._scrape_pool = ThreadPoolExecutor(
+                    max_workers=self.scraping_config.max_concurrent_scrapes,
+                    thread_name_prefix='scrape'
+                )
+            return self._scrape_pool
+    
+    def close(self):
+        """Shut down the scrape and notify thread pools, waiting for queued work."""
+        with self._scrape_pool_lock:
+            scrape_pool, self._scrape_pool = self._scrape_pool, None
+        if scrape_pool is not None:
+            scrape_pool.shutdown(wait=True)
+        self._notify_pool.shutdown(wait=True)
+    
+    def scrape_multiple_sites(self, urls: List[str], max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Scrape multiple websites concurrently for deals.
         
         Args:
             urls: List of URLs to scrape
+            max_workers: Optional cap on parallel scrapes, overriding max_concurrent_scrapes
             
         Returns:
             Summary of scraping results
@@ -220,10 +930,21 @@ class DealScraper:
             'errors': []
         }
         
-        with ThreadPoolExecutor(max_workers=self.scraping_config.max_concurrent_scrapes) as executor:
-            # Submit scraping tasks
+        notify_futures = []
+        found_deals = []
+        
+        if max_workers:
+            # A per-call cap gets its own pool, with no more threads than sites
+            pool = ThreadPoolExecutor(max_workers=min(len(urls), max_workers) or 1)
+        else:
+            # The shared pool only starts threads while none are idle, so a
+            # short URL list still uses no more threads than it has sites
+            pool = nullcontext(self._get_scrape_pool())
+        
+        with pool as executor:
+            # Submit scraping tasks; each queues its own deals for notification
             future_to_url = {
-                executor.submit(self.scrape_website_for_deals, url): url 
+                executor.submit(self._scrape_and_queue, url): url 
                 for url in urls
             }
             
@@ -231,20 +952,25 @@ class DealScraper:
             for future in as_completed(future_to_url):
                 url = future_to_url[future]
                 try:
-                    deals = future.result()
+                    deals, queued = future.result()
                     results['successful_scrapes'] += 1
                     results['total_deals_found'] += len(deals)
+                    notify_futures.extend(queued)
+                    found_deals.extend(deals)
                     
-                    # Process each deal
-                    for deal in deals:
-                        if self.process_deal(deal):
-                            results['deals_sent'] += 1
-                            
                 except Exception as e:
                     error_msg = f"Error scraping {url}: {e}"
                     results['errors'].append(error_msg)
                     self.logger.error(error_msg)
         
+        # Wait for this cycle's notifications
+        for future in as_completed(notify_futures):
+            if future.result():
+                results['deals_sent'] += 1
+        
+        if self.telegram_config.batch_size > 1:
+            results['deals_sent'] = self._process_deals_batched(found_deals)
+        
         return results
     
     def run_continuous_scraping(self, urls: List[str], custom_scraper: Optional[Callable] = None):
@@ -255,41 +981,51 @@ class DealScraper:
             urls: List of URLs to scrape
             custom_scraper: Optional custom scraping function
         """
-        self.logger.info(f"Starting continuous scraping of {len(urls)} sites")
-        self.logger.info(f"Scraping interval: {self.scraping_config.scrape_interval} seconds")
+        self.logger.info("Starting continuous scraping of %s sites", len(urls))
+        self.logger.info("Scraping interval: %s seconds", self.scraping_config.scrape_interval)
         
         # Test Telegram connection first
         if not self.notifier.test_connection():
             self.logger.error("Telegram connection test failed - aborting")
             return
         
+        interval = self.scraping_config.scrape_interval
+        
         try:
+            # Cycles start on a fixed cadence measured on the monotonic clock,
+            # so wall-clock adjustments can't stretch or skip a sleep
+            next_deadline = time.monotonic()
             while True:
-                start_time = time.time()
-                
                 if custom_scraper:
                     # Use custom scraper function
                     try:
                         deals = custom_scraper(urls)
-                        for deal in deals:
-                            self.process_deal(deal)
+                        sent = self.process_deals(deals)
+                        self.logger.info("Custom scraping cycle complete: %s of %s deals sent", sent, len(deals))
                     except Exception as e:
-                        self.logger.error(f"Custom scraper error: {e}")
+                        self.logger.error("Custom scraper error: %s", e)
                 else:
                     # Use built-in scraper
                     results = self.scrape_multiple_sites(urls)
-                    self.logger.info(f"Scraping cycle complete: {results}")
+                    self.logger.info("Scraping cycle complete: %s", results)
                 
-                # Calculate sleep time
-                elapsed_time = time.time() - start_time
-                sleep_time = max(0, self.scraping_config.scrape_interval - elapsed_time)
+                # Sleep until the next cycle is due
+                next_deadline += interval
+                sleep_time = next_deadline - time.monotonic()
                 
                 if sleep_time > 0:
-                    self.logger.info(f"Sleeping for {sleep_time:.1f} seconds until next scrape")
+                    self.logger.info("Sleeping for %.1f seconds until next scrape", sleep_time)
                     time.sleep(sleep_time)
+                else:
+                    # Overran the interval: start now and keep the cadence from
+                    # here rather than firing cycles back to back to catch up
+                    self.logger.warning("Scraping cycle overran the %s second interval by %.1f seconds",
+                                        interval, -sleep_time)
+                    next_deadline = time.monotonic()
                     
         except KeyboardInterrupt:
             self.logger.info("Scraping stopped by user")
+            self.close()
         except Exception as e:
-            self.logger.error(f"Unexpected error in continuous scraping: {e}")
+            self.logger.error("Unexpected error in continuous scraping: %s", e)
             raise